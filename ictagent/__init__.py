@@ -8,13 +8,11 @@ __version__ = "1.0.0"
 __author__ = "ajaygm18"
 
 from .core.trading_bot import ICTTradingBot
-from .core.base_strategy import StrategyBase, Signal, Trade, RiskConfig, BacktestConfig
+from .core.base_strategy import StrategyBase, RiskConfig, BacktestConfig
 
 __all__ = [
     "ICTTradingBot",
     "StrategyBase", 
-    "Signal",
-    "Trade",
     "RiskConfig",
     "BacktestConfig"
 ]
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Numba kernels for session mask construction."""
+
+import numpy as np
+from ictagent.utils._njit import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _session_mask_kernel(minutes: np.ndarray, start: int, end: int,
+                         overnight: bool, out: np.ndarray) -> None:
+    """Write the [start, end) minute-of-day mask into ``out`` in a single pass.
+    
+    Args:
+        minutes: EST minute-of-day per bar
+        start: Session start minute (inclusive)
+        end: Session end minute (exclusive)
+        overnight: True when the session spans midnight
+        out: Preallocated boolean array of the same length as ``minutes``
+    """
+    for i in prange(minutes.shape[0]):
+        m = minutes[i]
+        if overnight:
+            out[i] = (m >= start) or (m < end)
+        else:
+            out[i] = (m >= start) and (m < end)
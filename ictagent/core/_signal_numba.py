@@ -0,0 +1,32 @@
+"""Numba kernels for batch signal validation."""
+
+import numpy as np
+from ictagent.utils._njit import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _rr_valid_kernel(sides: np.ndarray, prices: np.ndarray, stops: np.ndarray,
+                     targets: np.ndarray, min_rr: float, out: np.ndarray) -> None:
+    """Write the risk/reward validity of each signal into ``out``.
+    
+    Args:
+        sides: +1 for long, -1 for short, 0 for no signal
+        prices: Entry prices
+        stops: Stop loss prices
+        targets: Take profit prices
+        min_rr: Minimum reward-to-risk ratio
+        out: Preallocated boolean array of the same length as ``sides``
+    """
+    for i in prange(sides.shape[0]):
+        side = sides[i]
+        price = prices[i]
+        if side > 0:
+            risk = price - stops[i]
+            reward = targets[i] - price
+        elif side < 0:
+            risk = stops[i] - price
+            reward = price - targets[i]
+        else:
+            risk = 0.0
+            reward = 0.0
+        out[i] = (risk > 0.0) and (reward >= min_rr * risk)
@@ -1,12 +1,25 @@
 """Base strategy class and core data structures for ICT trading framework."""
 
 from dataclasses import dataclass
+from datetime import time
 from typing import Optional, Dict, Any, List
 import pandas as pd
 import numpy as np
+from ictagent.core.sessions import SessionManager, NY_TZ
+from ictagent.utils._njit import numba_available
 
 
-@dataclass
+def _copy_on_write_active() -> bool:
+    """Whether pandas copy-on-write protects shallow copies from writes."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.options.mode.copy_on_write is True
+    except AttributeError:
+        return False
+
+
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
     """Risk management configuration."""
     initial_capital: float = 100000.0
@@ -17,7 +30,7 @@ class RiskConfig:
     max_daily_loss: float = 0.05  # 5% max daily loss
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstrumentMeta:
     """Instrument metadata for position sizing and risk calculations."""
     symbol: str
@@ -28,7 +41,7 @@ class InstrumentMeta:
     pip_value_per_standard_lot: float = 10.0  # USD per pip for 100k lot
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BacktestConfig:
     """Backtesting configuration."""
     engine: str = "backtrader"
@@ -60,6 +73,10 @@ class StrategyBase:
         self.risk: Optional[RiskConfig] = None
         self.signals: Optional[pd.DataFrame] = None
         
+        # Per-bar time keys cached by prepare() for session/day filters
+        self._minutes_of_day: Optional[np.ndarray] = None
+        self._day_id: Optional[np.ndarray] = None
+        
         # Common ICT parameters with defaults
         self.lookback_periods = self.params.get('lookback_periods', 20)
         self.min_displacement_pips = self.params.get('min_displacement_pips', 5)
@@ -74,13 +91,30 @@ class StrategyBase:
             meta: Instrument metadata for position sizing
             risk: Risk management configuration
         """
-        self.df = df.copy()
+        # Indicator columns are added to this frame only. Under copy-on-write
+        # a shallow copy is enough; otherwise in-place writes made by
+        # subclasses would reach the caller's OHLCV buffers, so copy them
+        self.df = df.copy(deep=not _copy_on_write_active())
         self.meta = meta
         self.risk = risk
         
+        # Drop keys from a previous prepare() so nothing reads a stale frame's
+        self._minutes_of_day = None
+        self._day_id = None
+        
         # Precompute indicators
         self._add_indicators()
         
+        # Cache EST minute-of-day and day keys once so subclasses compare
+        # against scalar ints instead of re-deriving times per filter. Built
+        # from the final frame, since overrides of _add_indicators may
+        # rebind or trim self.df
+        idx = self.df.index
+        if idx.tz is not None:
+            idx = idx.tz_convert(NY_TZ)
+        self._minutes_of_day = SessionManager.minutes_of_day(self.df.index)
+        self._day_id = idx.normalize().asi8
+        
         # Generate signals DataFrame
         self.signals = self.generate_signals()
 
@@ -91,9 +125,11 @@ class StrategyBase:
         # Add ATR for volatility filtering
         self.df['atr'] = atr(self.df, period=14)
         
-        # Add FVG detection
+        # Add FVG detection, inserting columns in place instead of concat
+        # so the existing frame is not reallocated. Assigning the frame (not
+        # raw arrays) keeps index alignment and extension dtypes
         fvg_data = detect_fvg(self.df)
-        self.df = pd.concat([self.df, fvg_data], axis=1)
+        self.df[fvg_data.columns.tolist()] = fvg_data
 
     def generate_signals(self) -> pd.DataFrame:
         """Generate trading signals DataFrame.
@@ -120,22 +156,138 @@ class StrategyBase:
         """
         return session_mask
     
-    def apply_atr_filter(self, atr_threshold: float = None) -> pd.Series:
+    def get_session_filter(self, timestamp: pd.Timestamp, session_start: time,
+                           session_end: time) -> bool:
+        """Check whether a single timestamp falls within a session in EST.
+        
+        Use get_session_filter_vec for whole indexes rather than calling
+        this per bar.
+        
+        Args:
+            timestamp: Timestamp to test (naive values are treated as EST)
+            session_start: Session start time (inclusive)
+            session_end: Session end time (exclusive), may be before start
+                for overnight sessions
+            
+        Returns:
+            True if timestamp is inside the session
+        """
+        ts = pd.Timestamp(timestamp)
+        if ts.tz is not None:
+            ts = ts.tz_convert(NY_TZ)
+        
+        minute = ts.hour * 60 + ts.minute
+        start = session_start.hour * 60 + session_start.minute
+        end = session_end.hour * 60 + session_end.minute
+        
+        # Minutes since session start wrap at midnight, so one comparison
+        # covers same-day and overnight sessions without branching
+        return (minute - start) % 1440 < (end - start) % 1440
+    
+    def get_session_filter_vec(self, index: pd.DatetimeIndex, session_start: time,
+                               session_end: time) -> np.ndarray:
+        """Vectorized session check for every timestamp in an index.
+        
+        Prefer this over calling get_session_filter inside a per-bar loop;
+        the whole mask is built in a single NumPy pass.
+        
+        Args:
+            index: DatetimeIndex to test (converted to EST)
+            session_start: Session start time (inclusive)
+            session_end: Session end time (exclusive), may be before start
+                for overnight sessions
+            
+        Returns:
+            Boolean array aligned with index
+        """
+        # minutes_of_day is memoized per index object, so repeated calls on
+        # self.df.index reuse one conversion without relying on prepare()
+        # having filled self._minutes_of_day yet
+        return SessionManager.window_mask(
+            SessionManager.minutes_of_day(index),
+            session_start.hour * 60 + session_start.minute,
+            session_end.hour * 60 + session_end.minute
+        )
+    
+    def apply_atr_filter(self, atr_threshold: float = None) -> np.ndarray:
         """Filter signals based on ATR volatility.
         
         Args:
             atr_threshold: Minimum ATR value for signal validity
             
         Returns:
-            Boolean mask where ATR >= threshold
+            Boolean array where ATR >= threshold, positionally aligned with
+            self.df so it can be combined with other masks without index
+            alignment
         """
         if atr_threshold is None:
             atr_threshold = self.atr_filter_threshold
             
         if 'atr' not in self.df.columns:
-            return pd.Series(True, index=self.df.index)
+            return np.ones(len(self.df), dtype=bool)
+            
+        atr = self.df['atr'].to_numpy(copy=False)
+        return atr >= atr_threshold
+    
+    @staticmethod
+    def validate_signals_batch(sides: np.ndarray, prices: np.ndarray,
+                               stops: np.ndarray, targets: np.ndarray,
+                               min_rr: float = 1.0) -> np.ndarray:
+        """Validate risk/reward for a batch of signals in one pass.
+        
+        A signal is valid when its stop and target sit on the correct side of
+        the entry and reward / risk >= min_rr. Uses a Numba kernel when numba
+        is installed.
+        
+        Args:
+            sides: +1 for long, -1 for short, 0 for no signal
+                (e.g. long_entry.astype(int) - short_entry.astype(int))
+            prices: Entry prices
+            stops: Stop loss prices
+            targets: Take profit prices
+            min_rr: Minimum reward-to-risk ratio
+            
+        Returns:
+            Boolean array aligned with the inputs
+        """
+        sides = np.asarray(sides, dtype=np.int8)
+        prices = np.asarray(prices, dtype=np.float64)
+        stops = np.asarray(stops, dtype=np.float64)
+        targets = np.asarray(targets, dtype=np.float64)
+        
+        if numba_available():
+            from ictagent.core._signal_numba import _rr_valid_kernel
+            out = np.empty(sides.shape[0], dtype=np.bool_)
+            _rr_valid_kernel(sides, prices, stops, targets, float(min_rr), out)
+            return out
+        
+        return StrategyBase.validate_signals_vec(sides, prices, stops, targets, min_rr)
+    
+    @staticmethod
+    def validate_signals_vec(sides: np.ndarray, prices: np.ndarray,
+                             stops: np.ndarray, targets: np.ndarray,
+                             min_rr: float = 1.0) -> np.ndarray:
+        """Branch-free NumPy version of validate_signals_batch.
+        
+        The side sign folds the long and short cases into one expression:
+        risk = side * (price - stop), reward = side * (target - price).
+        Signals with side 0 have zero risk and are never valid.
+        
+        Args:
+            sides: +1 for long, -1 for short, 0 for no signal
+            prices: Entry prices
+            stops: Stop loss prices
+            targets: Take profit prices
+            min_rr: Minimum reward-to-risk ratio
             
-        return self.df['atr'] >= atr_threshold
+        Returns:
+            Boolean array aligned with the inputs
+        """
+        sign = np.sign(np.asarray(sides)).astype(np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        risk = sign * (prices - np.asarray(stops, dtype=np.float64))
+        reward = sign * (np.asarray(targets, dtype=np.float64) - prices)
+        return (risk > 0) & (reward >= min_rr * risk)
     
     def get_strategy_info(self) -> Dict[str, Any]:
         """Get strategy information and parameters."""
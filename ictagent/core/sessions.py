@@ -1,11 +1,61 @@
 """ICT session management with EST/DST awareness."""
 
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 from typing import Tuple
-from datetime import time
+from ictagent.utils._njit import numba_available
 
 NY_TZ = "America/New_York"
 
+# ICT session windows as [start, end) minute-of-day in EST
+_SESSIONS = {
+    'premarket': (120, 420),    # 02:00-07:00
+    'ny_open': (570, 600),      # 09:30-10:00
+    'killzone': (600, 660),     # 10:00-11:00
+    'london_ny': (480, 660),    # 08:00-11:00
+    'power_hour': (840, 900),   # 14:00-15:00
+    'afternoon': (780, 960),    # 13:00-16:00
+}
+
+# Minute-of-day arrays keyed by id(index). The index itself is kept alongside
+# so an id reused by a new object after garbage collection is never a hit.
+_MINUTES_CACHE_SIZE = 8
+_minutes_cache: "OrderedDict[int, Tuple[pd.DatetimeIndex, np.ndarray]]" = OrderedDict()
+
+
+def _get_est_minutes(index: pd.DatetimeIndex) -> np.ndarray:
+    """Return EST minute-of-day (int32) for each timestamp, memoized per index.
+    
+    Repeated session checks on the same bar index reuse one tz_convert and
+    hour/minute extraction instead of redoing it per session.
+    """
+    key = id(index)
+    cached = _minutes_cache.get(key)
+    if cached is not None and cached[0] is index:
+        _minutes_cache.move_to_end(key)
+        return cached[1]
+    
+    # Naive timestamps are taken as EST wall time already, so hour/minute
+    # can be read directly without localizing
+    idx_est = index if index.tz is None else index.tz_convert(NY_TZ)
+    
+    minutes = (np.asarray(idx_est.hour, dtype=np.int32) * 60
+               + np.asarray(idx_est.minute, dtype=np.int32))
+    minutes.flags.writeable = False
+    
+    _minutes_cache[key] = (index, minutes)
+    if len(_minutes_cache) > _MINUTES_CACHE_SIZE:
+        _minutes_cache.popitem(last=False)
+    
+    return minutes
+
+
+def _mask_from_minutes(index: pd.DatetimeIndex, start: int, end: int) -> pd.Series:
+    """Boolean Series for timestamps within [start, end) minute-of-day in EST."""
+    mask = SessionManager.window_mask(_get_est_minutes(index), start, end)
+    return pd.Series(mask, index=index, copy=False)
+
 
 class SessionManager:
     """Manage ICT trading sessions with DST-aware EST timing."""
@@ -23,55 +73,80 @@ class SessionManager:
         Returns:
             Boolean Series mask
         """
-        # Convert to EST if needed
-        if index.tz is None:
-            idx_est = index.tz_localize(NY_TZ)
-        else:
-            idx_est = index.tz_convert(NY_TZ)
-        
-        start_time = time(start_hm[0], start_hm[1])
-        end_time = time(end_hm[0], end_hm[1])
+        # Integer minute-of-day avoids building a datetime.time per bar
+        start = start_hm[0] * 60 + start_hm[1]
+        end = end_hm[0] * 60 + end_hm[1]
         
-        current_times = idx_est.time
+        return _mask_from_minutes(index, start, end)
+    
+    @staticmethod
+    def window_mask(minutes: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Return boolean mask for minute-of-day values within [start, end).
         
-        if start_time <= end_time:
+        Args:
+            minutes: EST minute-of-day per bar (see minutes_of_day)
+            start: Session start minute (inclusive)
+            end: Session end minute (exclusive)
+            
+        Returns:
+            Boolean array aligned with minutes
+        """
+        if numba_available():
+            # Fused single pass into one preallocated buffer; the kernel
+            # module is imported here so loading ictagent skips numba
+            from ictagent.core._session_numba import _session_mask_kernel
+            mask = np.empty(minutes.shape[0], dtype=np.bool_)
+            _session_mask_kernel(minutes, start, end, start > end, mask)
+        elif start <= end:
             # Normal case: start and end on same day
-            mask = (current_times >= start_time) & (current_times < end_time)
+            mask = (minutes >= start) & (minutes < end)
         else:
             # Overnight session: spans midnight
-            mask = (current_times >= start_time) | (current_times < end_time)
+            mask = (minutes >= start) | (minutes < end)
             
-        return pd.Series(mask, index=index)
+        return mask
+    
+    @staticmethod
+    def minutes_of_day(index: pd.DatetimeIndex) -> np.ndarray:
+        """Return EST minute-of-day for each timestamp as a read-only int32 array.
+        
+        Args:
+            index: DatetimeIndex (naive timestamps are treated as EST)
+            
+        Returns:
+            Array of hour * 60 + minute, shared across calls on the same index
+        """
+        return _get_est_minutes(index)
     
     @classmethod
     def premarket_session(cls, index: pd.DatetimeIndex) -> pd.Series:
         """Pre-market session: 02:00-07:00 EST."""
-        return cls.in_time_window(index, (2, 0), (7, 0))
+        return _mask_from_minutes(index, *_SESSIONS['premarket'])
     
     @classmethod
     def ny_open_session(cls, index: pd.DatetimeIndex) -> pd.Series:
         """NY market open: 09:30-10:00 EST."""
-        return cls.in_time_window(index, (9, 30), (10, 0))
+        return _mask_from_minutes(index, *_SESSIONS['ny_open'])
     
     @classmethod
     def ny_killzone(cls, index: pd.DatetimeIndex) -> pd.Series:
         """NY Killzone (Silver Bullet): 10:00-11:00 EST."""
-        return cls.in_time_window(index, (10, 0), (11, 0))
+        return _mask_from_minutes(index, *_SESSIONS['killzone'])
     
     @classmethod
     def london_ny_overlap(cls, index: pd.DatetimeIndex) -> pd.Series:
         """London-NY overlap: 08:00-11:00 EST."""
-        return cls.in_time_window(index, (8, 0), (11, 0))
+        return _mask_from_minutes(index, *_SESSIONS['london_ny'])
     
     @classmethod
     def power_hour(cls, index: pd.DatetimeIndex) -> pd.Series:
         """Power Hour: 14:00-15:00 EST."""
-        return cls.in_time_window(index, (14, 0), (15, 0))
+        return _mask_from_minutes(index, *_SESSIONS['power_hour'])
     
     @classmethod
     def afternoon_session(cls, index: pd.DatetimeIndex) -> pd.Series:
         """Afternoon session: 13:00-16:00 EST."""
-        return cls.in_time_window(index, (13, 0), (16, 0))
+        return _mask_from_minutes(index, *_SESSIONS['afternoon'])
     
     @classmethod
     def get_session_mask(cls, index: pd.DatetimeIndex, session: str) -> pd.Series:
@@ -85,16 +160,8 @@ class SessionManager:
         Returns:
             Boolean mask for session
         """
-        session_map = {
-            'premarket': cls.premarket_session,
-            'ny_open': cls.ny_open_session,
-            'killzone': cls.ny_killzone,
-            'london_ny': cls.london_ny_overlap,
-            'power_hour': cls.power_hour,
-            'afternoon': cls.afternoon_session
-        }
+        if session not in _SESSIONS:
+            raise ValueError(f"Unknown session: {session}. Available: {list(_SESSIONS.keys())}")
         
-        if session not in session_map:
-            raise ValueError(f"Unknown session: {session}. Available: {list(session_map.keys())}")
-            
-        return session_map[session](index)
\ No newline at end of file
+        start, end = _SESSIONS[session]
+        return _mask_from_minutes(index, start, end)
\ No newline at end of file
@@ -1,11 +1,58 @@
 """Main trading bot orchestrating strategies and backtesting."""
 
-from typing import List, Dict, Any, Optional
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import pandas as pd
 from ictagent.core.base_strategy import StrategyBase, RiskConfig, BacktestConfig, InstrumentMeta
-from ictagent.data.loader import load_yfinance
-from ictagent.engines.backtest_backtrader import BacktraderEngine
-from ictagent.metrics.performance import PerformanceAnalyzer
+
+# Engine, analyzer and data loader pull in backtrader/yfinance, so they are
+# imported where used to keep `import ictagent` cheap
+if TYPE_CHECKING:
+    from ictagent.engines.backtest_backtrader import BacktraderEngine
+    from ictagent.metrics.performance import PerformanceAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+def _run_strategy(strategy: StrategyBase, df: pd.DataFrame, meta: InstrumentMeta,
+                  risk_config: RiskConfig, config: BacktestConfig,
+                  engine: Optional["BacktraderEngine"] = None,
+                  analyzer: Optional["PerformanceAnalyzer"] = None) -> Dict[str, Any]:
+    """Prepare, backtest and analyze one strategy.
+    
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    
+    Returns:
+        Dictionary with strategy_info, backtest_result and performance
+    """
+    from ictagent.engines.backtest_backtrader import BacktraderEngine
+    from ictagent.metrics.performance import PerformanceAnalyzer
+    
+    if engine is None:
+        engine = BacktraderEngine()
+    if analyzer is None:
+        analyzer = PerformanceAnalyzer()
+    
+    logger.info("Running backtest for %s...", strategy.name)
+    
+    # Prepare strategy with data
+    strategy.prepare(df, meta, risk_config)
+    
+    # Run backtest
+    result = engine.run_backtest(strategy, df, meta, risk_config, config)
+    
+    # Analyze performance
+    performance = analyzer.analyze(result['trades'], risk_config.initial_capital)
+    
+    logger.info("Completed %s: %d trades", strategy.name, len(result['trades']))
+    
+    return {
+        'strategy_info': strategy.get_strategy_info(),
+        'backtest_result': result,
+        'performance': performance
+    }
 
 
 class ICTTradingBot:
@@ -57,61 +104,148 @@ class ICTTradingBot:
             point_value=1.0
         )
     
-    def backtest(self, symbol: str, config: BacktestConfig) -> Dict[str, Any]:
+    def backtest(self, symbol: str, config: BacktestConfig,
+                 max_workers: int = 1) -> Dict[str, Any]:
         """Run backtest for all strategies on given symbol.
         
+        By default strategies run one after another in this process, and
+        each strategy's df and signals are populated afterwards. Passing
+        max_workers > 1 opts into running them in parallel worker processes,
+        with these trade-offs:
+        
+        - strategies must be picklable, so not defined in __main__ or a
+          notebook
+        - on spawn-start platforms (macOS, Windows) the calling script needs
+          an ``if __name__ == '__main__':`` guard
+        - log records emitted in workers are not forwarded
+        - the prepared state (df, signals) stays in the workers; use the
+          returned results rather than the strategy objects
+        
         Args:
             symbol: Trading symbol (e.g., 'ES=F', 'EURUSD=X')
             config: Backtest configuration
+            max_workers: Worker processes; 1 (default) runs everything in
+                this process
             
         Returns:
             Dictionary with backtest results
         """
+        from ictagent.data.loader import load_yfinance
+        
         if not self.strategies:
             raise ValueError("No strategies added to bot")
         
         # Load data
-        print(f"Loading data for {symbol}...")
+        logger.info("Loading data for %s...", symbol)
         df = load_yfinance(symbol, config.timeframe, config.start_date, config.end_date)
         
         if df.empty:
             raise ValueError(f"No data loaded for {symbol}")
         
-        print(f"Loaded {len(df)} bars from {df.index[0]} to {df.index[-1]}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded %d bars from %s to %s", len(df), df.index[0], df.index[-1])
         
         # Get instrument metadata
         meta = self.get_instrument_meta(symbol)
         
-        # Initialize backtest engine
-        engine = BacktraderEngine()
+        self.results = self._run_strategies(df, meta, config, max_workers)
+        return self.results
+    
+    def backtest_many(self, symbols: List[str], config: BacktestConfig,
+                      max_workers: int = 1) -> Dict[str, Dict[str, Any]]:
+        """Run backtest for all strategies on several symbols.
         
-        results = {}
+        Data for all symbols is fetched in one yfinance call up front. In
+        process, one engine and analyzer are reused across symbols; with
+        max_workers > 1, one process pool serves every symbol, so worker
+        start-up, imports and JIT cache loads are paid once per worker
+        rather than once per symbol. self.results is keyed as
+        "<strategy> [<symbol>]" so the summary and plotting helpers work.
         
-        # Run backtest for each strategy
-        for strategy in self.strategies:
-            print(f"\nRunning backtest for {strategy.name}...")
-            
-            # Prepare strategy with data
-            strategy.prepare(df, meta, self.risk_config)
-            
-            # Run backtest
-            result = engine.run_backtest(strategy, df, meta, self.risk_config, config)
+        Args:
+            symbols: Trading symbols (e.g., ['ES=F', 'EURUSD=X'])
+            config: Backtest configuration
+            max_workers: Worker processes, see backtest()
             
-            # Analyze performance
+        Returns:
+            Dictionary of symbol -> per-strategy backtest results
+        """
+        from ictagent.data.loader import load_yfinance_many
+        from ictagent.engines.backtest_backtrader import BacktraderEngine
+        from ictagent.metrics.performance import PerformanceAnalyzer
+        
+        if not self.strategies:
+            raise ValueError("No strategies added to bot")
+        
+        if not symbols:
+            raise ValueError("No symbols given")
+        
+        # One multi-symbol request instead of a round trip per symbol
+        logger.info("Loading data for %d symbols...", len(symbols))
+        frames = load_yfinance_many(symbols, config.timeframe,
+                                    config.start_date, config.end_date)
+        
+        if max_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+            engine = analyzer = None
+        else:
+            pool = nullcontext()
+            engine = BacktraderEngine()
             analyzer = PerformanceAnalyzer()
-            performance = analyzer.analyze(result['trades'], self.risk_config.initial_capital)
-            
-            results[strategy.name] = {
-                'strategy_info': strategy.get_strategy_info(),
-                'backtest_result': result,
-                'performance': performance
-            }
-            
-            print(f"Completed {strategy.name}: {len(result['trades'])} trades")
         
-        self.results = results
+        results = {}
+        with pool as executor:
+            for symbol, df in frames.items():
+                logger.info("Backtesting %s (%d bars)...", symbol, len(df))
+                meta = self.get_instrument_meta(symbol)
+                results[symbol] = self._run_strategies(df, meta, config, max_workers,
+                                                       engine, analyzer, executor)
+        
+        self.results = {
+            f"{name} [{symbol}]": result
+            for symbol, by_strategy in results.items()
+            for name, result in by_strategy.items()
+        }
         return results
     
+    def _run_strategies(self, df: pd.DataFrame, meta: InstrumentMeta,
+                        config: BacktestConfig,
+                        max_workers: int = 1,
+                        engine: Optional["BacktraderEngine"] = None,
+                        analyzer: Optional["PerformanceAnalyzer"] = None,
+                        executor: Optional[ProcessPoolExecutor] = None) -> Dict[str, Any]:
+        """Run every strategy on one dataset, keyed by strategy name.
+        
+        engine and analyzer are reused on the in-process path; worker
+        processes build their own. A given executor is used for the worker
+        path instead of starting a new pool, and is left open.
+        """
+        from ictagent.engines.backtest_backtrader import BacktraderEngine
+        from ictagent.metrics.performance import PerformanceAnalyzer
+        
+        if max_workers <= 1:
+            # Single engine shared across strategies in this process
+            if engine is None:
+                engine = BacktraderEngine()
+            if analyzer is None:
+                analyzer = PerformanceAnalyzer()
+            outputs = [_run_strategy(strategy, df, meta, self.risk_config, config,
+                                     engine, analyzer)
+                       for strategy in self.strategies]
+        else:
+            n = len(self.strategies)
+            pool = (nullcontext(executor) if executor is not None
+                    else ProcessPoolExecutor(max_workers=max_workers))
+            with pool as workers:
+                outputs = list(workers.map(
+                    _run_strategy, self.strategies, [df] * n, [meta] * n,
+                    [self.risk_config] * n, [config] * n
+                ))
+        
+        # Keep results in the order strategies were added
+        return {strategy.name: output
+                for strategy, output in zip(self.strategies, outputs)}
+    
     def get_performance_summary(self) -> pd.DataFrame:
         """Get performance summary for all strategies."""
         if not self.results:
@@ -139,7 +273,7 @@ class ICTTradingBot:
         from ictagent.utils.plotting import plot_equity_curve, plot_drawdown
         
         if not self.results:
-            print("No backtest results to plot. Run backtest first.")
+            logger.warning("No backtest results to plot. Run backtest first.")
             return
         
         strategies_to_plot = [strategy_name] if strategy_name else list(self.results.keys())
@@ -148,10 +282,10 @@ class ICTTradingBot:
             if name in self.results:
                 trades = self.results[name]['backtest_result']['trades']
                 if trades:
-                    print(f"\nPlotting results for {name}...")
+                    logger.info("Plotting results for %s...", name)
                     plot_equity_curve(trades, self.risk_config.initial_capital, name)
                     plot_drawdown(trades, self.risk_config.initial_capital, name)
                 else:
-                    print(f"No trades to plot for {name}")
+                    logger.info("No trades to plot for %s", name)
             else:
-                print(f"Strategy {name} not found in results")
\ No newline at end of file
+                logger.warning("Strategy %s not found in results", name)
\ No newline at end of file
@@ -1,11 +1,14 @@
 """Data loading and preprocessing modules."""
 
-from .loader import load_yfinance, load_csv
+from .loader import load_yfinance, load_yfinance_many, load_csv
 from .preprocess import resample_data, add_timezone
+from .frame import OHLCFrame
 
 __all__ = [
     "load_yfinance",
+    "load_yfinance_many",
     "load_csv", 
     "resample_data",
-    "add_timezone"
+    "add_timezone",
+    "OHLCFrame"
 ]
\ No newline at end of file
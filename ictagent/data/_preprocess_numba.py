@@ -0,0 +1,58 @@
+"""Numba kernels for OHLCV preprocessing."""
+
+import numpy as np
+from ictagent.utils._njit import njit, prange
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _ohlc_mask_kernel(o: np.ndarray, h: np.ndarray, l: np.ndarray,
+                      c: np.ndarray, out: np.ndarray) -> None:
+    """Write the clean_data validity of each bar into ``out`` in one pass.
+    
+    A bar is valid when its prices are positive, open and close lie within
+    [low, high], and it is not flat (all four prices equal).
+    
+    Args:
+        o, h, l, c: Open, high, low and close prices
+        out: Preallocated boolean array of the same length as the inputs
+    """
+    for i in prange(o.shape[0]):
+        oi, hi, li, ci = o[i], h[i], l[i], c[i]
+        flat = oi == hi and hi == li and li == ci
+        out[i] = (li > 0.0 and hi >= li and oi >= li and oi <= hi
+                  and ci >= li and ci <= hi and not flat)
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _ohlc_fixed_kernel(o: np.ndarray, h: np.ndarray, l: np.ndarray,
+                       c: np.ndarray, v: np.ndarray, bucket: int,
+                       oo: np.ndarray, oh: np.ndarray, ol: np.ndarray,
+                       oc: np.ndarray, ov: np.ndarray) -> None:
+    """Aggregate consecutive runs of ``bucket`` bars into OHLCV bins.
+    
+    Bin b covers input rows [b * bucket, (b + 1) * bucket); the last bin may
+    be partial. Produces first/max/min/last/sum in one read of each column.
+    
+    Args:
+        o, h, l, c, v: Input open, high, low, close and volume
+        bucket: Input bars per output bin
+        oo, oh, ol, oc, ov: Preallocated outputs, one element per bin
+    """
+    n = o.shape[0]
+    for b in prange(oo.shape[0]):
+        s = b * bucket
+        e = min(s + bucket, n)
+        oo[b] = o[s]
+        oc[b] = c[e - 1]
+        hi = h[s]
+        lo = l[s]
+        vs = v[s]
+        for i in range(s + 1, e):
+            if h[i] > hi:
+                hi = h[i]
+            if l[i] < lo:
+                lo = l[i]
+            vs += v[i]
+        oh[b] = hi
+        ol[b] = lo
+        ov[b] = vs
@@ -0,0 +1,74 @@
+"""Struct-of-arrays container for OHLCV bars."""
+
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True, eq=False)
+class OHLCFrame:
+    """OHLCV bars held as parallel NumPy arrays plus their DatetimeIndex.
+    
+    Preprocessing steps accept and return this in place of a DataFrame so a
+    pipeline works on contiguous column arrays throughout, building a
+    DataFrame only at the boundary with to_df().
+    """
+    index: pd.DatetimeIndex
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, downcast: bool = False) -> "OHLCFrame":
+        """Extract the OHLCV columns of df, without copying where possible.
+        
+        Args:
+            df: OHLCV DataFrame
+            downcast: Store OHLC as float32 (volume keeps its dtype)
+        """
+        frame = cls(
+            index=df.index,
+            o=df['open'].to_numpy(copy=False),
+            h=df['high'].to_numpy(copy=False),
+            l=df['low'].to_numpy(copy=False),
+            c=df['close'].to_numpy(copy=False),
+            v=df['volume'].to_numpy(copy=False)
+        )
+        return frame.downcast() if downcast else frame
+
+    def to_df(self) -> pd.DataFrame:
+        """Build an OHLCV DataFrame over the same arrays."""
+        return pd.DataFrame({
+            'open': self.o,
+            'high': self.h,
+            'low': self.l,
+            'close': self.c,
+            'volume': self.v
+        }, index=self.index, copy=False)
+
+    def downcast(self) -> "OHLCFrame":
+        """Return a frame with OHLC as float32, sharing arrays already float32."""
+        return OHLCFrame(
+            index=self.index,
+            o=self.o.astype(np.float32, copy=False),
+            h=self.h.astype(np.float32, copy=False),
+            l=self.l.astype(np.float32, copy=False),
+            c=self.c.astype(np.float32, copy=False),
+            v=self.v
+        )
+
+    def take(self, positions: np.ndarray) -> "OHLCFrame":
+        """Return the bars at the given integer positions."""
+        return OHLCFrame(
+            index=self.index[positions],
+            o=self.o[positions],
+            h=self.h[positions],
+            l=self.l[positions],
+            c=self.c[positions],
+            v=self.v[positions]
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
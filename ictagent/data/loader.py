@@ -1,13 +1,117 @@
 """Data loading from various sources (yfinance, CSV)."""
 
-from typing import Optional, Dict, Any
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 import pandas as pd
-import yfinance as yf
-from ictagent.utils.timezones import ensure_est_timezone
+from ictagent.data.preprocess import downcast_prices
+from ictagent.utils.timezones import NY_TZ, ensure_est_timezone
+
+logger = logging.getLogger(__name__)
+
+# On-disk parquet cache for downloaded bars, override with ICTAGENT_CACHE_DIR
+CACHE_DIR = Path(os.environ.get("ICTAGENT_CACHE_DIR",
+                                Path.home() / ".cache" / "ictagent"))
+
+def _cache_path(symbol: str, timeframe: str, start: Optional[str],
+                end: Optional[str], kwargs: Dict[str, Any]) -> Path:
+    """Return the parquet cache file for a yfinance query."""
+    key = f"{symbol}|{timeframe}|{start}|{end}|{sorted(kwargs.items())}"
+    return CACHE_DIR / f"{hashlib.md5(key.encode()).hexdigest()}.parquet"
+
+
+def _is_closed_range(end: Optional[str]) -> bool:
+    """Whether a query ends before today (NY time), so its bars are final.
+    
+    Open-ended queries and ones ending today or later still gain bars as
+    they print, so caching them would freeze a partial download.
+    """
+    if end is None:
+        return False
+    
+    end_ts = pd.Timestamp(end)
+    if end_ts.tz is not None:
+        end_ts = end_ts.tz_convert(NY_TZ).tz_localize(None)
+    today = pd.Timestamp.now(tz=NY_TZ).tz_localize(None).normalize()
+    
+    return end_ts.normalize() < today
+
+
+def _read_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Read cached bars, returning None on a miss or unreadable file."""
+    if not path.exists():
+        return None
+    
+    try:
+        df = pd.read_parquet(path)
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+    
+    # Stored in UTC, see _write_cache
+    return ensure_est_timezone(df)
+
+
+def _write_cache(df: pd.DataFrame, path: Path):
+    """Write bars to the cache, storing the index in UTC.
+    
+    Parquet keeps tz-aware UTC reliably, local wall times less so. The file
+    is written under a temporary name and moved into place so concurrent
+    readers never see a partial file.
+    """
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.tz_convert('UTC').to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except (ImportError, OSError, ValueError) as e:
+        logger.warning("Could not write cache file %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _default_start(timeframe: str, start: Optional[str]) -> Optional[str]:
+    """Fill in a start date within yfinance's intraday history limits."""
+    if start is None and timeframe in ['1m', '5m', '15m']:
+        # Use reasonable defaults based on yfinance limitations
+        if timeframe == '1m':
+            start = pd.Timestamp.now() - pd.Timedelta(days=7)
+        else:
+            start = pd.Timestamp.now() - pd.Timedelta(days=60)
+        start = start.strftime('%Y-%m-%d')
+    return start
+
+
+def _standardize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a flat yfinance frame to lowercase OHLCV in EST, deduplicated."""
+    # Standardize column names
+    df.columns = [col.lower().replace(' ', '_') for col in df.columns]
+    
+    # Remove adjusted close if present
+    if 'adj_close' in df.columns:
+        df = df.drop(columns=['adj_close'])
+    
+    # Ensure we have required OHLCV columns
+    required_cols = ['open', 'high', 'low', 'close', 'volume']
+    missing_cols = [col for col in required_cols if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Missing required columns: {missing_cols}")
+    
+    # Convert to EST timezone
+    df = ensure_est_timezone(df)
+    
+    # Remove any duplicate timestamps; clean downloads are strictly increasing
+    # so skip the hash pass and frame copy in the common case
+    if not (df.index.is_monotonic_increasing and df.index.is_unique):
+        df = df[~df.index.duplicated(keep='first')]
+    
+    return df
 
 
 def load_yfinance(symbol: str, timeframe: str = "5m", 
                  start: Optional[str] = None, end: Optional[str] = None,
+                 use_cache: bool = True, downcast: bool = True,
                  **kwargs) -> pd.DataFrame:
     """Download intraday OHLCV from yfinance with EST timezone.
     
@@ -16,6 +120,8 @@ def load_yfinance(symbol: str, timeframe: str = "5m",
         timeframe: Data interval ('1m', '5m', '15m', '1h', '1d')
         start: Start date string (YYYY-MM-DD)
         end: End date string (YYYY-MM-DD)
+        use_cache: Read/write the parquet cache under CACHE_DIR
+        downcast: Return OHLC columns as float32 (volume is unchanged)
         **kwargs: Additional yfinance.download parameters
         
     Returns:
@@ -24,15 +130,22 @@ def load_yfinance(symbol: str, timeframe: str = "5m",
     Notes:
         - yfinance intraday limitations: 1m ~7 days, 5m/15m ~60 days
         - For longer backtests, use daily data or CSV files
+        - Only queries ending before today (NY time) are cached; open or
+          current ranges keep growing as new bars print
     """
-    # Set default date range if not provided
-    if start is None and timeframe in ['1m', '5m', '15m']:
-        # Use reasonable defaults based on yfinance limitations
-        if timeframe == '1m':
-            start = pd.Timestamp.now() - pd.Timedelta(days=7)
-        else:
-            start = pd.Timestamp.now() - pd.Timedelta(days=60)
-        start = start.strftime('%Y-%m-%d')
+    start = _default_start(timeframe, start)
+    
+    cache_path = None
+    if use_cache and _is_closed_range(end):
+        cache_path = _cache_path(symbol, timeframe, start, end, kwargs)
+        df = _read_cache(cache_path)
+        if df is not None:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Loaded %d cached bars for %s from %s to %s",
+                            len(df), symbol, df.index[0], df.index[-1])
+            return downcast_prices(df) if downcast else df
+    
+    import yfinance as yf
     
     # Download data
     try:
@@ -44,6 +157,8 @@ def load_yfinance(symbol: str, timeframe: str = "5m",
             auto_adjust=False,
             prepost=True,  # Include pre/post market data
             progress=False,
+            group_by='column',
+            multi_level_index=False,  # Flat OHLCV columns, no symbol level
             **kwargs
         )
     except Exception as e:
@@ -52,32 +167,105 @@ def load_yfinance(symbol: str, timeframe: str = "5m",
     if df.empty:
         raise ValueError(f"No data returned for {symbol} {timeframe} {start} to {end}")
     
-    # Handle multi-level columns from yfinance
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.droplevel(1)  # Remove symbol level
+    assert not isinstance(df.columns, pd.MultiIndex), "expected flat yfinance columns"
     
-    # Standardize column names
-    df.columns = [col.lower().replace(' ', '_') for col in df.columns]
+    df = _standardize_ohlcv(df)
     
-    # Remove adjusted close if present
-    if 'adj_close' in df.columns:
-        df = df.drop(columns=['adj_close'])
+    # Cache full precision so either downcast setting can be served from it
+    if cache_path is not None:
+        _write_cache(df, cache_path)
     
-    # Ensure we have required OHLCV columns
-    required_cols = ['open', 'high', 'low', 'close', 'volume']
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"Missing required columns: {missing_cols}")
+    if downcast:
+        df = downcast_prices(df)
     
-    # Convert to EST timezone
-    df = ensure_est_timezone(df)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Loaded %d bars for %s from %s to %s",
+                    len(df), symbol, df.index[0], df.index[-1])
     
-    # Remove any duplicate timestamps
-    df = df[~df.index.duplicated(keep='first')]
+    return df
+
+
+def load_yfinance_many(symbols: List[str], timeframe: str = "5m",
+                      start: Optional[str] = None, end: Optional[str] = None,
+                      use_cache: bool = True, downcast: bool = True,
+                      **kwargs) -> Dict[str, pd.DataFrame]:
+    """Download OHLCV for several symbols in a single yfinance call.
     
-    print(f"Loaded {len(df)} bars for {symbol} from {df.index[0]} to {df.index[-1]}")
+    Symbols found in the parquet cache are read from disk; the rest are
+    fetched together with threads=True, so the download costs one round of
+    requests instead of one per symbol.
     
-    return df
+    Args:
+        symbols: Trading symbols (e.g., ['ES=F', 'EURUSD=X'])
+        timeframe: Data interval ('1m', '5m', '15m', '1h', '1d')
+        start: Start date string (YYYY-MM-DD)
+        end: End date string (YYYY-MM-DD)
+        use_cache: Read/write the parquet cache under CACHE_DIR
+        downcast: Return OHLC columns as float32 (volume is unchanged)
+        **kwargs: Additional yfinance.download parameters
+        
+    Returns:
+        Dictionary of symbol -> DataFrame with OHLCV data in EST timezone,
+        in the order given
+    """
+    start = _default_start(timeframe, start)
+    
+    frames: Dict[str, pd.DataFrame] = {}
+    cache_paths: Dict[str, Path] = {}
+    if use_cache and _is_closed_range(end):
+        for symbol in symbols:
+            cache_paths[symbol] = _cache_path(symbol, timeframe, start, end, kwargs)
+            df = _read_cache(cache_paths[symbol])
+            if df is not None:
+                frames[symbol] = df
+    
+    missing = [symbol for symbol in symbols if symbol not in frames]
+    if missing:
+        import yfinance as yf
+        
+        try:
+            df_all = yf.download(
+                ' '.join(missing),
+                interval=timeframe,
+                start=start,
+                end=end,
+                auto_adjust=False,
+                prepost=True,  # Include pre/post market data
+                progress=False,
+                group_by='ticker',
+                threads=True,
+                **kwargs
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to download data for {missing}: {str(e)}")
+        
+        for symbol in missing:
+            if isinstance(df_all.columns, pd.MultiIndex):
+                if symbol not in df_all.columns.get_level_values(0):
+                    raise ValueError(f"No data returned for {symbol} {timeframe} {start} to {end}")
+                df = df_all[symbol]
+            else:
+                df = df_all
+            
+            # Rows come aligned across symbols, drop the ones this symbol lacks
+            df = df.dropna(how='all')
+            if df.empty:
+                raise ValueError(f"No data returned for {symbol} {timeframe} {start} to {end}")
+            
+            df = _standardize_ohlcv(df)
+            if symbol in cache_paths:
+                _write_cache(df, cache_paths[symbol])
+            frames[symbol] = df
+    
+    result = {}
+    for symbol in symbols:
+        df = frames[symbol]
+        result[symbol] = downcast_prices(df) if downcast else df
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded %d bars for %s from %s to %s",
+                        len(df), symbol, df.index[0], df.index[-1])
+    
+    return result
 
 
 def load_csv(filepath: str, datetime_col: str = 'datetime', 
@@ -132,6 +320,8 @@ def get_symbol_info(symbol: str) -> Dict[str, Any]:
     Returns:
         Dictionary with symbol information
     """
+    import yfinance as yf
+    
     try:
         ticker = yf.Ticker(symbol)
         info = ticker.info
@@ -145,5 +335,5 @@ def get_symbol_info(symbol: str) -> Dict[str, Any]:
             'market_cap': info.get('marketCap', None)
         }
     except Exception as e:
-        print(f"Warning: Could not fetch info for {symbol}: {e}")
+        logger.warning("Could not fetch info for %s: %s", symbol, e)
         return {'symbol': symbol, 'name': symbol, 'exchange': 'Unknown'}
\ No newline at end of file
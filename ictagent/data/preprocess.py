@@ -1,36 +1,149 @@
 """Data preprocessing utilities."""
 
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Optional, Union
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import DateOffset, Tick
+from ictagent.data.frame import OHLCFrame
+from ictagent.utils.timezones import filter_market_hours
+from ictagent.utils._njit import numba_available
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
-def resample_data(df: pd.DataFrame, timeframe: str, 
-                 method: str = 'ohlc') -> pd.DataFrame:
+PRICE_COLS = ('open', 'high', 'low', 'close')
+
+# clean_data validity test as a single numexpr expression
+_OHLC_VALID_EXPR = ("(l > 0) & (h >= l) & (o >= l) & (o <= h) & (c >= l) & (c <= h)"
+                    " & ~((o == h) & (h == l) & (l == c))")
+
+# Parsed resample rules for the framework's timeframe strings. pandas does not
+# read a bare 'm' as minutes, so the yfinance-style keys need mapping anyway
+_TF_OFFSETS = {
+    '1m': to_offset('1min'),
+    '5m': to_offset('5min'),
+    '15m': to_offset('15min'),
+    '1min': to_offset('1min'),
+    '5min': to_offset('5min'),
+    '15min': to_offset('15min'),
+    '1h': to_offset('1h'),
+    '4h': to_offset('4h'),
+    '1d': to_offset('1D'),
+}
+
+_OHLC_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+
+def downcast_prices(df: pd.DataFrame) -> pd.DataFrame:
+    """Store OHLC as float32, halving memory traffic through indicators.
+    
+    Quotes carry at most 6-7 significant digits, which float32 holds exactly
+    enough for tick-level comparisons. Volume is left untouched.
+    """
+    return df.astype({col: np.float32 for col in PRICE_COLS})
+
+
+def _resample_fixed(df: pd.DataFrame, rule: DateOffset) -> Optional[pd.DataFrame]:
+    """OHLC resample of regularly spaced bars with the Numba kernel.
+    
+    Applies only when every output bin holds the same number of consecutive
+    input rows: numba is available, the rule is a sub-daily fixed frequency
+    that is a multiple of the input spacing, the first bar sits on a bin edge
+    (pandas anchors bins at midnight of the first day), and the OHLCV columns
+    are NaN-free. Returns None otherwise so the caller uses pandas.
+    """
+    index = df.index
+    if len(index) < 2 or not isinstance(rule, Tick) or not numba_available():
+        return None
+    
+    rule_td = pd.Timedelta(rule)
+    step = index[1] - index[0]
+    if (rule_td >= pd.Timedelta(days=1) or step <= pd.Timedelta(0)
+            or rule_td % step != pd.Timedelta(0)
+            or (index[0] - index[0].normalize()) % rule_td != pd.Timedelta(0)):
+        return None
+    
+    diffs = np.diff(index.asi8)
+    if not (diffs == diffs[0]).all():
+        return None
+    
+    cols = [df[col].to_numpy(copy=False) for col in _OHLC_AGG]
+    if any(arr.dtype.kind == 'f' and np.isnan(arr).any() for arr in cols):
+        return None
+    
+    bucket = rule_td // step
+    n_out = -(-len(index) // bucket)
+    out = [np.empty(n_out, dtype=arr.dtype) for arr in cols]
+    from ictagent.data._preprocess_numba import _ohlc_fixed_kernel
+    _ohlc_fixed_kernel(*cols, bucket, *out)
+    
+    return pd.DataFrame(dict(zip(_OHLC_AGG, out)), index=index[::bucket], copy=False)
+
+
+def resample_data(df: Union[pd.DataFrame, OHLCFrame], timeframe: str, 
+                 method: str = 'ohlc',
+                 downcast: bool = False,
+                 session: Optional[str] = None) -> Union[pd.DataFrame, OHLCFrame]:
     """Resample OHLCV data to different timeframe.
     
     Args:
-        df: OHLCV DataFrame
+        df: OHLCV DataFrame or OHLCFrame
         timeframe: Target timeframe ('1m', '5m', '15m', '1h', '4h', '1d')
         method: Resampling method ('ohlc' or 'mean')
+        downcast: Convert OHLC to float32 before resampling
+        session: Keep only 'regular' or 'extended' market hours before
+            resampling; None resamples every bar
         
     Returns:
-        Resampled DataFrame
+        Resampled data, same type as df
     """
+    if isinstance(df, OHLCFrame):
+        return OHLCFrame.from_df(resample_data(df.to_df(), timeframe, method,
+                                               downcast, session))
+    
+    if session is not None:
+        df = filter_market_hours(df, session)
+    
+    if downcast:
+        df = downcast_prices(df)
+    
+    rule = _TF_OFFSETS.get(timeframe)
+    if rule is None:
+        rule = to_offset(timeframe)
+    
     if method == 'ohlc':
-        resampled = df.resample(timeframe).agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        })
-    else:
-        resampled = df.resample(timeframe).mean()
+        # Regular bars bin by position, no groupby needed
+        resampled = _resample_fixed(df, rule)
+        if resampled is not None:
+            return resampled
+        
+        # Drop extra columns and fix the order so the frame reaching agg
+        # holds only the OHLCV blocks it reduces
+        cols = list(_OHLC_AGG)
+        if list(df.columns) != cols:
+            df = df[cols]
+        
+        resampled = df.resample(rule).agg(_OHLC_AGG)
+        
+        # Empty bins are the only source of NaN in 'first', so testing the
+        # open column alone finds them without a full-frame NaN scan. A
+        # session filter still leaves overnight and weekend bins empty.
+        keep = ~np.isnan(resampled['open'].to_numpy())
+        return resampled.iloc[np.flatnonzero(keep)]
     
-    # Remove any NaN rows
-    resampled = resampled.dropna()
+    resampled = df.resample(rule).mean()
     
-    return resampled
+    # Remove any NaN rows
+    return resampled.dropna()
 
 
 def add_timezone(df: pd.DataFrame, timezone: str = 'America/New_York') -> pd.DataFrame:
@@ -51,38 +164,61 @@ def add_timezone(df: pd.DataFrame, timezone: str = 'America/New_York') -> pd.Dat
     return df
 
 
-def clean_data(df: pd.DataFrame, remove_gaps: bool = True) -> pd.DataFrame:
+def _ohlc_valid_mask(o: np.ndarray, h: np.ndarray, l: np.ndarray,
+                     c: np.ndarray) -> np.ndarray:
+    """Boolean mask of bars passing the clean_data OHLC checks."""
+    if numba_available():
+        # One read of each column, one write of the mask, no temporaries
+        from ictagent.data._preprocess_numba import _ohlc_mask_kernel
+        mask = np.empty(o.shape[0], dtype=np.bool_)
+        _ohlc_mask_kernel(o, h, l, c, mask)
+        return mask
+    
+    if ne is not None:
+        # Evaluated blockwise across threads, each column read once
+        return ne.evaluate(_OHLC_VALID_EXPR, local_dict={'o': o, 'h': h, 'l': l, 'c': c})
+    
+    # Positive prices with open/close inside the high-low range; l > 0 and
+    # the range checks imply all four prices are positive
+    mask = l > 0
+    np.logical_and(mask, h >= l, out=mask)
+    np.logical_and(mask, o >= l, out=mask)
+    np.logical_and(mask, o <= h, out=mask)
+    np.logical_and(mask, c >= l, out=mask)
+    np.logical_and(mask, c <= h, out=mask)
+    
+    # Remove rows where OHLC are all the same (potential data issues)
+    flat = o == h
+    np.logical_and(flat, h == l, out=flat)
+    np.logical_and(flat, l == c, out=flat)
+    np.logical_and(mask, ~flat, out=mask)
+    
+    return mask
+
+
+def clean_data(df: Union[pd.DataFrame, OHLCFrame], remove_gaps: bool = True,
+               downcast: bool = False) -> Union[pd.DataFrame, OHLCFrame]:
     """Clean OHLCV data by removing invalid bars and gaps.
     
     Args:
-        df: OHLCV DataFrame
+        df: OHLCV DataFrame or OHLCFrame
         remove_gaps: Whether to remove weekend gaps
+        downcast: Convert OHLC to float32 before validating
         
     Returns:
-        Cleaned DataFrame
+        Cleaned data, same type as df
     """
-    # Remove rows where OHLC are all the same (potential data issues)
-    valid_bars = ~((df['open'] == df['high']) & 
-                   (df['high'] == df['low']) & 
-                   (df['low'] == df['close']))
-    
-    df_clean = df[valid_bars].copy()
-    
-    # Remove rows with zero or negative prices
-    price_cols = ['open', 'high', 'low', 'close']
-    valid_prices = (df_clean[price_cols] > 0).all(axis=1)
-    df_clean = df_clean[valid_prices]
-    
-    # Ensure high >= low
-    valid_hl = df_clean['high'] >= df_clean['low']
-    df_clean = df_clean[valid_hl]
+    if downcast:
+        df = df.downcast() if isinstance(df, OHLCFrame) else downcast_prices(df)
     
-    # Ensure OHLC relationships
-    valid_ohlc = ((df_clean['open'] >= df_clean['low']) & 
-                  (df_clean['open'] <= df_clean['high']) &
-                  (df_clean['close'] >= df_clean['low']) & 
-                  (df_clean['close'] <= df_clean['high']))
+    if isinstance(df, OHLCFrame):
+        mask = _ohlc_valid_mask(df.o, df.h, df.l, df.c)
+        return df.take(np.flatnonzero(mask))
     
-    df_clean = df_clean[valid_ohlc]
+    mask = _ohlc_valid_mask(df['open'].to_numpy(copy=False),
+                            df['high'].to_numpy(copy=False),
+                            df['low'].to_numpy(copy=False),
+                            df['close'].to_numpy(copy=False))
     
-    return df_clean
\ No newline at end of file
+    # One positional gather per column block, no boolean indexer checks
+    return df.take(np.flatnonzero(mask))
\ No newline at end of file
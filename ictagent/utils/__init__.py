@@ -1,10 +1,17 @@
 """Utility modules for ICT framework."""
 
 from .timezones import ensure_est_timezone
-from .plotting import plot_equity_curve, plot_drawdown
 
 __all__ = [
     "ensure_est_timezone",
     "plot_equity_curve",
     "plot_drawdown"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Plotting pulls in matplotlib, so only import it when first requested
+    if name in ("plot_equity_curve", "plot_drawdown"):
+        from . import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
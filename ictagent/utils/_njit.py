@@ -0,0 +1,41 @@
+"""Optional Numba support with a no-op fallback when numba is not installed.
+
+numba is imported on first use rather than with ictagent, so callers check
+numba_available() and import their kernel module at the dispatch point.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def numba_available() -> bool:
+    """Import numba once and report whether it is usable."""
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _njit_fallback(*args, **kwargs):
+    """No-op stand-in for numba.njit supporting bare and parameterized use."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+
+    return decorator
+
+
+def __getattr__(name):
+    # Resolved lazily so importing this module does not load numba
+    if name in ("njit", "prange"):
+        if numba_available():
+            import numba
+            return getattr(numba, name)
+        return _njit_fallback if name == "njit" else range
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["njit", "prange", "numba_available"]  # noqa: F822 - njit/prange come from __getattr__
@@ -1,30 +1,58 @@
 """Timezone handling utilities for EST/DST awareness."""
 
+from datetime import time
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Union, Tuple
 
 NY_TZ = "America/New_York"
 
+# Zones resolved once through pandas rather than by string on every call.
+# This yields the same object a string-based tz_convert ends up with (pytz or
+# zoneinfo depending on the pandas version), so indexes stay comparable.
+_NY_TZ_OBJ = pd.DatetimeIndex([], tz=NY_TZ).tz
+_UTC_TZ_OBJ = pd.DatetimeIndex([], tz='UTC').tz
+
+# Market hours as inclusive (start, end) minute-of-day in EST
+_MARKET_HOURS = {
+    'regular': (570, 960),     # 09:30-16:00
+    'extended': (240, 1200),   # 04:00-20:00
+}
+
 
 def ensure_est_timezone(df: pd.DataFrame) -> pd.DataFrame:
     """Ensure DataFrame has EST timezone on its index.
     
+    Only the index is replaced; the returned frame shares its column data
+    with the input, and a frame already in EST is returned as is.
+    
     Args:
         df: DataFrame with datetime index
         
     Returns:
         DataFrame with EST timezone
     """
-    df_copy = df.copy()
+    tz = df.index.tz
     
-    if df_copy.index.tz is None:
+    if tz is _NY_TZ_OBJ:
+        # Indexes built by this module share the cached tz object
+        return df
+    
+    if tz is None:
         # No timezone info - assume UTC and convert to EST
-        df_copy.index = df_copy.index.tz_localize('UTC').tz_convert(NY_TZ)
-    elif df_copy.index.tz.zone != NY_TZ:
+        new_index = df.index.tz_localize(_UTC_TZ_OBJ).tz_convert(_NY_TZ_OBJ)
+    elif str(tz) != NY_TZ:
         # Different timezone - convert to EST
-        df_copy.index = df_copy.index.tz_convert(NY_TZ)
+        new_index = df.index.tz_convert(_NY_TZ_OBJ)
+    else:
+        return df
     
-    return df_copy
+    # Shallow copy shares the column data; set_axis(copy=False) is
+    # deprecated in newer pandas
+    out = df.copy(deep=False)
+    out.index = new_index
+    return out
 
 
 def convert_to_utc(timestamp: Union[pd.Timestamp, pd.DatetimeIndex]) -> Union[pd.Timestamp, pd.DatetimeIndex]:
@@ -36,21 +64,26 @@ def convert_to_utc(timestamp: Union[pd.Timestamp, pd.DatetimeIndex]) -> Union[pd
     Returns:
         UTC timestamp or DatetimeIndex
     """
-    if isinstance(timestamp, pd.DatetimeIndex):
-        if timestamp.tz is None:
-            return timestamp.tz_localize(NY_TZ).tz_convert('UTC')
-        else:
-            return timestamp.tz_convert('UTC')
-    else:
-        if timestamp.tz is None:
-            return timestamp.tz_localize(NY_TZ).tz_convert('UTC')
-        else:
-            return timestamp.tz_convert('UTC')
+    # Timestamp and DatetimeIndex share the tz/tz_localize/tz_convert API
+    if timestamp.tz is None:
+        timestamp = timestamp.tz_localize(_NY_TZ_OBJ)
+    return timestamp.tz_convert(_UTC_TZ_OBJ)
+
+
+def _market_hours_bounds(session: str) -> Tuple[int, int]:
+    """Return (start, end) minute-of-day for a market hours session."""
+    try:
+        return _MARKET_HOURS[session]
+    except KeyError:
+        raise ValueError("session must be 'regular' or 'extended'") from None
 
 
 def is_market_hours(timestamp: pd.Timestamp, session: str = 'regular') -> bool:
     """Check if timestamp falls within market hours.
     
+    Deprecated for per-row use over a frame; use filter_market_hours or
+    is_market_hours_arr instead.
+    
     Args:
         timestamp: EST timestamp
         session: 'regular' (9:30-16:00), 'extended' (4:00-20:00)
@@ -58,19 +91,62 @@ def is_market_hours(timestamp: pd.Timestamp, session: str = 'regular') -> bool:
     Returns:
         True if within market hours
     """
-    time = timestamp.time()
+    start, end = _market_hours_bounds(session)
+    minute = timestamp.hour * 60 + timestamp.minute
     
-    if session == 'regular':
-        return time >= pd.Time(9, 30) and time <= pd.Time(16, 0)
-    elif session == 'extended':
-        return time >= pd.Time(4, 0) and time <= pd.Time(20, 0)
-    else:
-        raise ValueError("session must be 'regular' or 'extended'")
+    return start <= minute <= end
+
+
+def is_market_hours_arr(index: pd.DatetimeIndex, session: str = 'regular') -> np.ndarray:
+    """Vectorized is_market_hours for every timestamp in an index.
+    
+    Args:
+        index: EST DatetimeIndex
+        session: 'regular' (9:30-16:00), 'extended' (4:00-20:00)
+        
+    Returns:
+        Boolean array, True where within market hours
+    """
+    start, end = _market_hours_bounds(session)
+    minutes = (np.asarray(index.hour, dtype=np.int16) * np.int16(60)
+               + np.asarray(index.minute, dtype=np.int16))
+    
+    return (minutes >= start) & (minutes <= end)
+
+
+def filter_market_hours(df: pd.DataFrame, session: str = 'regular') -> pd.DataFrame:
+    """Keep only the rows of df that fall within market hours.
+    
+    Uses DataFrame.between_time, which tests the whole index in one pass and
+    follows the wall clock of the index through DST changes.
+    
+    Args:
+        df: DataFrame with EST DatetimeIndex
+        session: 'regular' (9:30-16:00), 'extended' (4:00-20:00)
+        
+    Returns:
+        DataFrame restricted to market hours (both bounds inclusive)
+    """
+    start, end = _market_hours_bounds(session)
+    
+    return df.between_time(time(start // 60, start % 60), time(end // 60, end % 60),
+                           inclusive='both')
+
+
+@lru_cache(maxsize=128)
+def _trading_days(start: str, end: str) -> pd.DatetimeIndex:
+    """Memoized business-day calendar behind get_trading_days."""
+    # Business-day calendar directly, weekends are never materialized
+    return pd.bdate_range(start=start, end=end, tz=_NY_TZ_OBJ)
 
 
 def get_trading_days(start: str, end: str) -> pd.DatetimeIndex:
     """Get trading days between start and end dates.
     
+    The calendar is memoized per (start, end). Each call returns a new
+    index object viewing the cached data, so setting attributes such as
+    .name on the result does not leak into later calls.
+    
     Args:
         start: Start date string (YYYY-MM-DD)
         end: End date string (YYYY-MM-DD)
@@ -78,10 +154,4 @@ def get_trading_days(start: str, end: str) -> pd.DatetimeIndex:
     Returns:
         DatetimeIndex of trading days in EST
     """
-    # Create date range
-    dates = pd.date_range(start=start, end=end, freq='D', tz=NY_TZ)
-    
-    # Filter to weekdays (Monday=0, Sunday=6)
-    trading_days = dates[dates.weekday < 5]
-    
-    return trading_days
\ No newline at end of file
+    return _trading_days(start, end).view()